@@ -72,6 +72,7 @@ EXTENSIONS = {
         "language": "c++",
     },
     "_clinical_kernel": {"sources": ["sksurv/kernels/_clinical_kernel.pyx"]},
+    "_concordance": {"sources": ["sksurv/_concordance.pyx"]},
     "_coxph_loss": {"sources": ["sksurv/ensemble/_coxph_loss.pyx"]},
     "_prsvm": {"sources": ["sksurv/svm/_prsvm.pyx"]},
     "_minlip": {"sources": ["sksurv/svm/_minlip.pyx"]},
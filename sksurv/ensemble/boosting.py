@@ -40,6 +40,11 @@ from .survival_loss import (
     IPCWLeastSquaresError,
 )
 
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover
+    bn = np
+
 __all__ = [
     "ComponentwiseGradientBoostingSurvivalAnalysis",
     "GradientBoostingSurvivalAnalysis",
@@ -91,8 +96,7 @@ def _fit_stage_componentwise(
         error[component] = squared_norm(residuals - l_pred)
         base_learners.append(learner)
 
-    # TODO: could use bottleneck.nanargmin for speed
-    best_component = np.nanargmin(error)
+    best_component = bn.nanargmin(error)
     best_learner = base_learners[best_component]
     return best_learner
 
@@ -14,14 +14,15 @@ import numbers
 
 import numpy as np
 from collections import namedtuple
-from sklearn.base import BaseEstimator
+from joblib import Parallel, delayed
+from scipy.linalg.blas import get_blas_funcs
+from sklearn.base import BaseEstimator, clone
 from sklearn.ensemble._base import BaseEnsemble
 from sklearn.ensemble._gb import VerboseReporter
 from sklearn.ensemble._gradient_boosting import _random_sample_mask
 from sklearn.linear_model import LinearRegression
 from sklearn.utils import check_random_state
 from sklearn.utils._param_validation import Interval, StrOptions
-from sklearn.utils.extmath import squared_norm
 from sklearn.utils.validation import _check_sample_weight, check_is_fitted
 from tqdm import tqdm
 
@@ -35,14 +36,23 @@ from .survival_loss import (
     IPCWLeastSquaresError,
 )
 
+try:
+    import bottleneck as bn
+except ImportError:  # pragma: no cover
+    bn = np
+
 __all__ = ["ComponentwiseGenGradientBoostingSurvivalAnalysis"]
 
 
 def _sample_binomial_plus_one(p, size, random_state):
     drop_model = random_state.binomial(1, p=p, size=size)
-    n_dropped = np.sum(drop_model)
+    n_dropped = drop_model.sum()
     if n_dropped == 0:
-        idx = random_state.randint(0, size)
+        if hasattr(random_state, "integers"):
+            # np.random.Generator (PCG64) draws integers via integers()
+            idx = random_state.integers(0, size)
+        else:
+            idx = random_state.randint(0, size)
         drop_model[idx] = 1
         n_dropped = 1
     return drop_model, n_dropped
@@ -53,10 +63,10 @@ class _ComponentwiseBaseLearner(BaseEstimator):
         self.component = component
         self.regr = regr
 
-    def fit(self, X, y, sample_weight):
-        try:
+    def fit(self, X, y, sample_weight, support_sample_weight=False):
+        if support_sample_weight:
             self.regr.fit(X, y, sample_weight=sample_weight)
-        except Exception as e:
+        else:
             self.regr.fit(X, y)
         return self.regr
 
@@ -64,24 +74,111 @@ class _ComponentwiseBaseLearner(BaseEstimator):
         return self.regr.predict(X[:, self.component], **kwargs)
 
 
+def _fit_one_component(
+    component, X, residuals, sample_weight, regr, r2, support_sample_weight
+):
+    """Fit a single base learner and return it with its squared error.
+
+    If ``support_sample_weight`` is None, whether ``regr`` accepts
+    ``sample_weight`` is probed by attempting the fit and falling back on
+    TypeError. Signature inspection cannot decide this: wrappers such as
+    nnetsauce regressors advertise ``sample_weight`` but forward it to an
+    inner estimator that may reject it. The resolved flag is returned so
+    callers can cache it for all remaining fits.
+    """
+    base = _ComponentwiseBaseLearner(component, regr=regr)
+    if support_sample_weight is None:
+        try:
+            learner = base.fit(
+                X, residuals, sample_weight, support_sample_weight=True
+            )
+            support_sample_weight = True
+        except TypeError:
+            learner = base.fit(
+                X, residuals, sample_weight, support_sample_weight=False
+            )
+            support_sample_weight = False
+    else:
+        learner = base.fit(X, residuals, sample_weight, support_sample_weight)
+    l_pred = learner.predict(X)
+    # ||r - p||^2 = ||r||^2 - 2 r.p + ||p||^2 with ||r||^2 precomputed,
+    # avoiding the temporary residuals - l_pred array
+    err = r2 - 2 * np.dot(residuals, l_pred) + np.dot(l_pred, l_pred)
+    return learner, err, support_sample_weight
+
+
 def _fit_stage_componentwise(
-    X, residuals, sample_weight, regr, **fit_params
+    X,
+    residuals,
+    sample_weight,
+    regr,
+    n_jobs=None,
+    support_sample_weight=None,
+    **fit_params,
 ):  # pylint: disable=unused-argument
-    """Fit component-wise weighted least squares model"""
+    """Fit component-wise weighted least squares model.
+
+    ``support_sample_weight=None`` means support is unknown; it is then
+    resolved at runtime by the first base-learner fit and returned, so
+    the caller only pays for the try/except once per ``fit`` call.
+    """
     n_features = X.shape[1]
 
-    base_learners = []
-    error = np.empty(n_features)
-    for component in range(n_features):
-        learner = _ComponentwiseBaseLearner(component, regr=regr).fit(
-            X, residuals, sample_weight
+    # Fast path for the default linear learner: the regressor is fitted on
+    # the full matrix irrespective of the component, so every candidate
+    # yields the same closed-form least-squares solution and a single fit
+    # replaces the per-feature loop.
+    if type(regr) is LinearRegression:
+        learner, _, support_sample_weight = _fit_one_component(
+            0, X, residuals, sample_weight, clone(regr), 0.0, support_sample_weight
         )
-        l_pred = learner.predict(X)
-        error[component] = squared_norm(residuals - l_pred)
-        base_learners.append(learner)
+        return learner, 0, support_sample_weight
+
+    r2 = np.dot(residuals, residuals)
+
+    # without parallelism, track a running minimum so that at most one
+    # fitted learner is kept alive instead of all n_features candidates
+    if n_jobs is None or n_jobs == 1:
+        best_learner = None
+        best_component = 0
+        best_error = np.inf
+        for component in range(n_features):
+            learner, err, support_sample_weight = _fit_one_component(
+                component,
+                X,
+                residuals,
+                sample_weight,
+                clone(regr),
+                r2,
+                support_sample_weight,
+            )
+            if err < best_error:
+                best_error = err
+                best_learner = learner
+                best_component = component
+        if best_learner is None:
+            raise ValueError("could not fit any base learner")
+        return best_learner, best_component, support_sample_weight
+
+    # fitting one learner per component is embarrassingly parallel;
+    # cheap linear learners release the GIL inside BLAS, so prefer threads
+    prefer = "threads" if isinstance(regr, LinearRegression) else None
+    results = Parallel(n_jobs=n_jobs, prefer=prefer)(
+        delayed(_fit_one_component)(
+            component,
+            X,
+            residuals,
+            sample_weight,
+            clone(regr),
+            r2,
+            support_sample_weight,
+        )
+        for component in range(n_features)
+    )
+    error = np.array([err for _, err, _ in results])
 
-    # TODO: could use bottleneck.nanargmin for speed
-    return base_learners[np.nanargmin(error)]
+    best_component = bn.nanargmin(error)
+    return results[best_component][0], best_component, results[0][2]
 
 
 class ComponentwiseGenGradientBoostingSurvivalAnalysis(
@@ -141,6 +238,18 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
     show_progress : bool, default: True
         If set, show a progress bar for the fitting process.
 
+    n_jobs : int, optional, default: None
+        Number of jobs to run in parallel when searching for the best
+        base learner in each boosting iteration. ``None`` means 1 unless
+        in a :obj:`joblib.parallel_backend` context. ``-1`` means using
+        all processors.
+
+    dtype : numpy dtype, optional, default: numpy.float64
+        Floating point type used for the feature matrix and the
+        prediction accumulators. Using ``numpy.float32`` halves memory
+        bandwidth at slightly reduced precision. Loss values are always
+        accumulated in float64.
+
     Attributes
     ----------
     estimators_ : list of base learners
@@ -191,6 +300,8 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         "dropout_rate": [Interval(numbers.Real, 0.0, 1.0, closed="left")],
         "random_state": ["random_state"],
         "verbose": ["verbose"],
+        "n_jobs": [numbers.Integral, None],
+        "dtype": "no_validation",
     }
 
     def __init__(
@@ -206,6 +317,8 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         random_state=None,
         verbose=0,
         show_progress=True,
+        n_jobs=None,
+        dtype=np.float64,
     ):
         self.regr = regr
         self.loss = loss
@@ -217,6 +330,8 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         self.random_state = random_state
         self.verbose = verbose
         self.show_progress = show_progress
+        self.n_jobs = n_jobs
+        self.dtype = dtype
         self.quantiles_ = None
 
     @property
@@ -228,6 +343,7 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
 
     def _init_state(self):
         self.estimators_ = np.empty(self.n_estimators, dtype=object)
+        self._components_ = np.zeros(self.n_estimators, dtype=np.intp)
 
         self.train_score_ = np.zeros(self.n_estimators, dtype=np.float64)
         # do oob?
@@ -245,18 +361,26 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         """Add additional ``n_estimators`` entries to all attributes."""
         # self.n_estimators is the number of additional est to fit
         total_n_estimators = self.n_estimators
+        grow = total_n_estimators > self.estimators_.shape[0]
 
-        self.estimators_ = np.resize(self.estimators_, total_n_estimators)
-        self.train_score_ = np.resize(self.train_score_, total_n_estimators)
+        if grow:
+            self.estimators_ = np.resize(self.estimators_, total_n_estimators)
+            self._components_ = np.resize(
+                self._components_, total_n_estimators
+            )
+            self.train_score_ = np.resize(
+                self.train_score_, total_n_estimators
+            )
         if self.subsample < 1 or hasattr(self, "oob_improvement_"):
             # if do oob resize arrays or create new if not available
             if hasattr(self, "oob_improvement_"):
-                self.oob_improvement_ = np.resize(
-                    self.oob_improvement_, total_n_estimators
-                )
-                self.oob_scores_ = np.resize(
-                    self.oob_scores_, total_n_estimators
-                )
+                if grow:
+                    self.oob_improvement_ = np.resize(
+                        self.oob_improvement_, total_n_estimators
+                    )
+                    self.oob_scores_ = np.resize(
+                        self.oob_scores_, total_n_estimators
+                    )
                 self.oob_score_ = np.nan
             else:
                 self.oob_improvement_ = np.zeros(
@@ -274,13 +398,16 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
                     "supported if the previous fit used dropout_rate > 0 too"
                 )
 
-            self._scale = np.resize(self._scale, total_n_estimators)
+            if grow:
+                self._scale = np.resize(self._scale, total_n_estimators)
             self._scale[self.n_estimators_ :] = 1
 
     def _clear_state(self):
         """Clear the state of the gradient boosting model."""
         if hasattr(self, "estimators_"):
             self.estimators_ = np.empty(0, dtype=object)
+        if hasattr(self, "_components_"):
+            del self._components_
         if hasattr(self, "train_score_"):
             del self.train_score_
         if hasattr(self, "oob_improvement_"):
@@ -291,30 +418,49 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
             del self.oob_score_
         if hasattr(self, "_rng"):
             del self._rng
+        if hasattr(self, "_dropout_rng"):
+            del self._dropout_rng
         if hasattr(self, "_scale"):
             del self._scale
+        if hasattr(self, "_stage_pred_train"):
+            del self._stage_pred_train
+        if hasattr(self, "_n_valid_stage_pred"):
+            del self._n_valid_stage_pred
 
     def _update_with_dropout(self, i, X, raw_predictions, scale, random_state):
-        # select base learners to be dropped for next iteration
+        # select base learners to be dropped for next iteration; prefer the
+        # persistent PCG64 generator over the legacy RandomState
+        rng = getattr(self, "_dropout_rng", random_state)
         drop_model, n_dropped = _sample_binomial_plus_one(
-            self.dropout_rate, i + 1, random_state
+            self.dropout_rate, i + 1, rng
         )
 
         # adjust scaling factor of tree that is going to be trained in next iteration
         scale[i + 1] = 1.0 / (n_dropped + 1.0)
 
+        # adjust scaling factor of dropped trees
+        dropped_idx = np.flatnonzero(drop_model[: i + 1])
+        kept_idx = np.flatnonzero(drop_model[: i + 1] == 0)
+        scale[dropped_idx] *= n_dropped / (n_dropped + 1.0)
+
+        # pseudoresponse of next iteration (without contribution of dropped trees);
+        # accumulate all kept stages in a single scale-weighted reduction
         raw_predictions[:] = 0
-        for m in range(i + 1):
-            if drop_model[m] == 1:
-                # adjust scaling factor of dropped trees
-                scale[m] *= n_dropped / (n_dropped + 1.0)
+        if kept_idx.size > 0:
+            pred_cache = getattr(self, "_stage_pred_train", None)
+            if (
+                pred_cache is not None
+                and pred_cache.shape[1] == raw_predictions.shape[0]
+                and getattr(self, "_n_valid_stage_pred", 0) > i
+            ):
+                # reuse the per-stage predictions memoized during this
+                # fit; stale rows from a previous fit are never used
+                preds = pred_cache[kept_idx]
             else:
-                # pseudoresponse of next iteration (without contribution of dropped trees)
-                raw_predictions += (
-                    self.learning_rate
-                    * scale[m]
-                    * self.estimators_[m].predict(X)
-                )
+                preds = np.empty((kept_idx.size, X.shape[0]), dtype=np.float64)
+                for k, m in enumerate(kept_idx):
+                    preds[k] = self.estimators_[m].predict(X)
+            raw_predictions[:] = self.learning_rate * (scale[kept_idx] @ preds)
 
     def _fit(
         self,
@@ -327,10 +473,9 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         begin_at_stage=0,
     ):  # noqa: C901
         n_samples = X.shape[0]
-        # account for intercept
-        y = np.fromiter(
-            zip(event, time), dtype=[("event", bool), ("time", np.float64)]
-        )
+        y = np.empty(n_samples, dtype=[("event", bool), ("time", np.float64)])
+        y["event"] = event
+        y["time"] = time
 
         do_oob = self.subsample < 1.0
         if do_oob:
@@ -339,11 +484,45 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         do_dropout = self.dropout_rate > 0
         if do_dropout:
             scale = self._scale
+            if not hasattr(self, "_dropout_rng"):
+                # seed the faster PCG64 generator from the legacy
+                # RandomState; sklearn's _random_sample_mask still
+                # requires the latter
+                self._dropout_rng = np.random.default_rng(
+                    random_state.randint(np.iinfo(np.int32).max)
+                )
+            # memoize each stage's predictions on the training data, so
+            # dropout updates do not have to re-predict all prior stages
+            n_estimators = int(self.n_estimators)
+            if (
+                not hasattr(self, "_stage_pred_train")
+                or self._stage_pred_train.shape[1] != n_samples
+            ):
+                self._stage_pred_train = np.empty(
+                    (n_estimators, n_samples),
+                    dtype=getattr(self, "dtype", np.float64),
+                )
+            elif self._stage_pred_train.shape[0] < n_estimators:
+                self._stage_pred_train = np.resize(
+                    self._stage_pred_train, (n_estimators, n_samples)
+                )
 
         if self.verbose:
             verbose_reporter = VerboseReporter(verbose=self.verbose)
             verbose_reporter.init(self, 0)
 
+        # reused by losses that support writing their gradient into a
+        # caller-provided buffer, avoiding one allocation per iteration
+        residual_buf = np.empty(n_samples, dtype=np.float64)
+
+        # None means unknown: the first base-learner fit probes support
+        # at runtime and the resolved flag is reused for all remaining
+        # stages and iterations
+        support_sample_weight = None
+
+        # saxpy for float32 accumulators, daxpy for float64
+        axpy = get_blas_funcs("axpy", (y_pred,))
+
         # perform boosting iterations
         i = begin_at_stage
         if self.show_progress:
@@ -356,46 +535,80 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
                 sample_mask = _random_sample_mask(
                     n_samples, n_inbag, random_state
                 )
+                oob_mask = ~sample_mask
                 subsample_weight = sample_weight * sample_mask.astype(
                     np.float64
                 )
 
-                # OOB score before adding this stage
-                y_oob_masked = y[~sample_mask]
-                sample_weight_oob_masked = sample_weight[~sample_mask]
+                # gather the masked arrays once per iteration and reuse
+                # them for every loss evaluation below
+                y_inbag_masked = y[sample_mask]
+                sample_weight_inbag_masked = sample_weight[sample_mask]
+                y_oob_masked = y[oob_mask]
+                sample_weight_oob_masked = sample_weight[oob_mask]
                 if i == 0:  # store the initial loss to compute the OOB score
                     initial_loss = self.loss_obj(
                         y_true=y_oob_masked,
-                        raw_prediction=y_pred[~sample_mask],
+                        raw_prediction=y_pred[oob_mask],
                         sample_weight=sample_weight_oob_masked,
                     )
             else:
                 subsample_weight = sample_weight
 
             residuals = self.loss_obj.gradient(
-                y, y_pred, sample_weight=sample_weight
+                y, y_pred, sample_weight=sample_weight, out=residual_buf
             )
 
-            best_learner = _fit_stage_componentwise(
-                X, residuals, subsample_weight, regr=self.regr
+            (
+                best_learner,
+                best_component,
+                support_sample_weight,
+            ) = _fit_stage_componentwise(
+                X,
+                residuals,
+                subsample_weight,
+                regr=self.regr,
+                # like dtype, n_jobs may be unset on subclasses that do
+                # not call super().__init__
+                n_jobs=getattr(self, "n_jobs", None),
+                support_sample_weight=support_sample_weight,
             )
             self.estimators_[i] = best_learner
-
-            if do_dropout and i < len(scale) - 1:
-                self._update_with_dropout(i, X, y_pred, scale, random_state)
+            self._components_[i] = best_component
+
+            if do_dropout:
+                self._stage_pred_train[i] = best_learner.predict(X)
+                if self._n_valid_stage_pred == i:
+                    # all rows up to and including i were computed on
+                    # the current training data
+                    self._n_valid_stage_pred = i + 1
+                if i < len(scale) - 1:
+                    self._update_with_dropout(
+                        i, X, y_pred, scale, random_state
+                    )
+                else:
+                    # y_pred += learning_rate * pred as one fused BLAS call
+                    y_pred = axpy(
+                        self._stage_pred_train[i],
+                        y_pred,
+                        a=self.learning_rate,
+                    )
             else:
-                y_pred += self.learning_rate * best_learner.predict(X)
+                pred = np.asarray(
+                    best_learner.predict(X), dtype=y_pred.dtype
+                ).ravel()
+                y_pred = axpy(pred, y_pred, a=self.learning_rate)
 
             # track loss
             if do_oob:
                 self.train_score_[i] = self.loss_obj(
-                    y_true=y[sample_mask],
+                    y_true=y_inbag_masked,
                     raw_prediction=y_pred[sample_mask],
-                    sample_weight=sample_weight[sample_mask],
+                    sample_weight=sample_weight_inbag_masked,
                 )
                 self.oob_scores_[i] = self.loss_obj(
                     y_true=y_oob_masked,
-                    raw_prediction=y_pred[~sample_mask],
+                    raw_prediction=y_pred[oob_mask],
                     sample_weight=sample_weight_oob_masked,
                 )
                 previous_loss = (
@@ -412,7 +625,7 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
             if self.verbose > 0:
                 verbose_reporter.update(i, self)
 
-        return i + 1
+        return i + 1, y_pred
 
     def fit(self, X, y, sample_weight=None):
         """Fit estimator.
@@ -439,13 +652,26 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         if not self.warm_start:
             self._clear_state()
 
-        X = self._validate_data(X, ensure_min_samples=2)
+        # per-stage predictions cached by a previous fit may refer to
+        # different training data, even if the number of samples happens
+        # to match; rows only become valid again as stages are trained
+        # on the data of this call
+        self._n_valid_stage_pred = 0
+
+        # subclasses such as SurvivalCustom set their parameters by hand
+        # without calling super().__init__, so ``dtype`` may be unset
+        dtype = getattr(self, "dtype", np.float64)
+
+        X = self._validate_data(
+            X,
+            ensure_min_samples=2,
+            dtype=dtype if dtype == np.float32 else "numeric",
+        )
         event, time = check_array_survival(X, y)
 
         sample_weight = _check_sample_weight(sample_weight, X)
 
         n_samples = X.shape[0]
-        Xi = np.column_stack((np.ones(n_samples), X))
 
         self.loss_obj = LOSS_FUNCTIONS[self.loss]()
         if isinstance(
@@ -456,7 +682,7 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         if not self._is_fitted():
             self._init_state()
 
-            y_pred = np.zeros(n_samples, dtype=np.float64)
+            y_pred = np.zeros(n_samples, dtype=dtype)
 
             begin_at_stage = 0
 
@@ -472,30 +698,67 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
                     % (self.n_estimators, self.estimators_.shape[0])
                 )
             begin_at_stage = self.estimators_.shape[0]
-            y_pred = self._raw_predict(Xi)
+            y_pred = self._raw_predict(X)
             self._resize_state()
 
             # apply dropout to last stage of previous fit
             if hasattr(self, "_scale") and self.dropout_rate > 0:
                 # pylint: disable-next=access-member-before-definition
                 self._update_with_dropout(
-                    self.n_estimators_ - 1, Xi, y_pred, self._scale, self._rng
+                    self.n_estimators_ - 1, X, y_pred, self._scale, self._rng
                 )
 
-        self.n_estimators_ = self._fit(
-            Xi, event, time, y_pred, sample_weight, self._rng, begin_at_stage
+        self.n_estimators_, y_pred = self._fit(
+            X, event, time, y_pred, sample_weight, self._rng, begin_at_stage
         )
 
-        self.set_baseline_model(X, event, time)
+        self._cache_linear_learners()
+        # without dropout, y_pred holds the final raw predictions on the
+        # training data; reuse them instead of predicting all stages again
+        risk_scores = y_pred if self.dropout_rate == 0 else None
+        self.set_baseline_model(X, event, time, risk_scores=risk_scores)
         try:
-            self.X_ = self.regr.X_
+            # base learners are fitted on clones of ``self.regr``
+            self.X_ = self.estimators_[self.n_estimators_ - 1].X_
         except AttributeError:
             pass
+
+        if not self.warm_start:
+            # the per-stage training predictions are only consulted during
+            # training; keeping them would inflate the memory footprint
+            # and pickle size by n_estimators x n_samples floats. Only a
+            # warm start benefits from carrying them over.
+            if hasattr(self, "_stage_pred_train"):
+                del self._stage_pred_train
+            if hasattr(self, "_n_valid_stage_pred"):
+                del self._n_valid_stage_pred
         return self
 
-    def set_baseline_model(self, X, event, time):
+    def _cache_linear_learners(self):
+        """Aggregate fitted linear base learners for batched prediction.
+
+        The additive ensemble of linear learners collapses into a single
+        linear model, so prediction becomes one matrix-vector product
+        instead of one predict call per estimator.
+        """
+        coef_sum = None
+        intercept_sum = 0.0
+        for estimator in self.estimators_:
+            if type(estimator) is not LinearRegression:
+                self._linear_coef_sum = None
+                return
+            if coef_sum is None:
+                coef_sum = estimator.coef_.copy()
+            else:
+                coef_sum += estimator.coef_
+            intercept_sum += estimator.intercept_
+        self._linear_coef_sum = coef_sum
+        self._linear_intercept_sum = intercept_sum
+
+    def set_baseline_model(self, X, event, time, risk_scores=None):
         if isinstance(self.loss_obj, CoxPH):
-            risk_scores = self._predict(X)
+            if risk_scores is None:
+                risk_scores = self._predict(X)
             self.baseline_model = BreslowEstimator().fit(
                 risk_scores, event, time
             )
@@ -521,15 +784,21 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
                 "DescribeResult", ["mean", "lower", "upper"]
             )
             return DescribeResult(pred["mean"], pred["lower"], pred["upper"])
-        pred = np.zeros(X.shape[0], dtype=float)
-        for estimator in self.estimators_:
-            pred += self.learning_rate * estimator.predict(X, **kwargs)
-        return pred
+        # batched path for ensembles of plain linear learners
+        coef_sum = getattr(self, "_linear_coef_sum", None)
+        if coef_sum is not None and not kwargs:
+            return self.learning_rate * (
+                X @ coef_sum + self._linear_intercept_sum
+            )
+        # stack per-stage predictions and reduce once instead of
+        # accumulating with one Python-level axpy per estimator
+        preds = np.empty((len(self.estimators_), X.shape[0]), dtype=float)
+        for m, estimator in enumerate(self.estimators_):
+            preds[m] = estimator.predict(X, **kwargs)
+        return self.learning_rate * preds.sum(axis=0)
 
     def _predict(self, X, **kwargs):
-        # account for intercept
-        Xi = np.column_stack((np.ones(X.shape[0]), X))
-        pred = self._raw_predict(Xi, **kwargs)
+        pred = self._raw_predict(X, **kwargs)
         if len(np.asarray(pred).shape) == 1:
             return self.loss_obj._scale_raw_prediction(pred)
         if ("return_std" in kwargs) or ("return_pi" in kwargs):
@@ -542,7 +811,7 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
             ]
             return DescribeResult(res[0], res[1], res[2])
 
-    def predict(self, X, **kwargs):
+    def predict(self, X, check_input=True, **kwargs):
         """Predict risk scores.
 
         If `loss='coxph'`, predictions can be interpreted as log hazard ratio
@@ -555,13 +824,18 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
         X : array-like, shape = (n_samples, n_features)
             Data matrix.
 
+        check_input : boolean, default: True
+            Allow to bypass several input checking.
+            Don't use this parameter unless you know what you do.
+
         Returns
         -------
         risk_score : array, shape = (n_samples,)
             Predicted risk scores.
         """
         check_is_fitted(self, "estimators_")
-        X = self._validate_data(X, reset=False)
+        if check_input:
+            X = self._validate_data(X, reset=False)
         return self._predict(X, **kwargs)
 
     def get_baseline_model(self):
@@ -754,19 +1028,12 @@ class ComponentwiseGenGradientBoostingSurvivalAnalysis(
 
     @property
     def feature_importances_(self):
-        imp = np.empty(self.n_features_in_ + 1, dtype=object)
-        for i in range(imp.shape[0]):
-            imp[i] = []
-
-        for k, estimator in enumerate(self.estimators_):
-            imp[estimator.component].append(k + 1)
-
-        def _importance(x):
-            if len(x) > 0:
-                return np.min(x)
-            return np.nan
-
-        ret = np.array([_importance(x) for x in imp])
+        # importance of a feature is the first boosting stage (1-based)
+        # that selected it, NaN if it was never selected
+        components = self._components_[: self.n_estimators_]
+        stages = np.arange(1, components.shape[0] + 1, dtype=np.float64)
+        ret = np.full(self.n_features_in_, np.nan)
+        np.fmin.at(ret, components, stages)
         return ret
 
     def _make_estimator(self, append=True, random_state=None):
@@ -41,7 +41,8 @@ class CoxPH(SurvivalLossFunction):
         return coxph_loss(
             y_true["event"].astype(np.uint8),
             y_true["time"],
-            raw_prediction.ravel(),
+            # the Cython kernel operates on float64
+            raw_prediction.ravel().astype(np.float64, copy=False),
         )
 
     def gradient(
@@ -59,7 +60,8 @@ class CoxPH(SurvivalLossFunction):
         ret = coxph_negative_gradient(
             y_true["event"].astype(np.uint8),
             y_true["time"],
-            raw_prediction.ravel(),
+            # the Cython kernel operates on float64
+            raw_prediction.ravel().astype(np.float64, copy=False),
         )
         if sample_weight is not None:
             ret *= sample_weight
@@ -130,9 +132,13 @@ class CensoredSquaredLoss(SurvivalLossFunction):
         """
         pred_time = y_true["time"] - raw_prediction.ravel()
         mask = (pred_time > 0) | y_true["event"]
-        ret = np.zeros(y_true["event"].shape[0])
-        ret[mask] = pred_time.compress(mask, axis=0)
-        return ret
+        out = kwargs.get("out")
+        if out is None:
+            out = np.zeros(y_true["event"].shape[0])
+        else:
+            out[:] = 0
+        out[mask] = pred_time.compress(mask, axis=0)
+        return out
 
     def update_terminal_regions(
         self,
@@ -190,7 +196,9 @@ class IPCWLeastSquaresError(SurvivalLossFunction):
     def gradient(
         self, y_true, raw_prediction, **kwargs
     ):  # pylint: disable=unused-argument
-        return y_true["time"] - raw_prediction.ravel()
+        return np.subtract(
+            y_true["time"], raw_prediction.ravel(), out=kwargs.get("out")
+        )
 
     def update_terminal_regions(
         self,
@@ -10,12 +10,18 @@
 #
 # You should have received a copy of the GNU General Public License
 # along with this program.  If not, see <http://www.gnu.org/licenses/>.
+import numexpr
 import numpy as np
 from sklearn.base import BaseEstimator
 from sklearn.utils import check_array, check_consistent_length
 from sklearn.utils.metaestimators import available_if
 from sklearn.utils.validation import check_is_fitted
 
+try:
+    from ._concordance import count_concordant_tied as _count_concordant_tied_ext
+except ImportError:  # pragma: no cover
+    _count_concordant_tied_ext = None
+
 from .exceptions import NoComparablePairException
 from .nonparametric import (
     CensoringDistributionEstimator,
@@ -50,16 +56,19 @@ def _check_inputs(event_indicator, event_time, estimate):
     event_indicator = check_array(
         event_indicator, ensure_2d=False, input_name="event_indicator"
     )
-    event_time = check_array(
-        event_time, ensure_2d=False, input_name="event_time"
-    )
-    estimate = _check_estimate_1d(estimate, event_time)
 
+    # fail fast on a wrong label dtype before validating the remaining arrays;
+    # check_array above does not copy since the input is left untouched
     if not np.issubdtype(event_indicator.dtype, np.bool_):
         raise ValueError(
             f"only boolean arrays are supported as class labels for survival analysis, got {event_indicator.dtype}"
         )
 
+    event_time = check_array(
+        event_time, ensure_2d=False, input_name="event_time"
+    )
+    estimate = _check_estimate_1d(estimate, event_time)
+
     if len(event_time) < 2:
         raise ValueError("Need a minimum of two samples")
 
@@ -102,36 +111,90 @@ def _check_estimate_2d(estimate, test_time, time_points, estimator):
     return estimate, time_points
 
 
-def _iter_comparable(event_indicator, event_time, order):
+def _iter_comparable(event_indicator, event_time):
+    """Iterate comparable samples, expects inputs sorted by ``event_time``."""
     n_samples = len(event_time)
     tied_time = 0
-    i = 0
-    while i < n_samples - 1:
-        time_i = event_time[order[i]]
-        end = i + 1
-        while end < n_samples and event_time[order[end]] == time_i:
-            end += 1
+    # find the boundaries of all tied-time groups in one vectorized pass
+    _, first_idx, counts = np.unique(
+        event_time, return_index=True, return_counts=True
+    )
+    for start, count in zip(first_idx, counts):
+        if start >= n_samples - 1:
+            break
+        end = start + count
 
         # check for tied event times
-        event_at_same_time = event_indicator[order[i:end]]
+        event_at_same_time = event_indicator[start:end]
         censored_at_same_time = ~event_at_same_time
+        n_censored_at_same_time = censored_at_same_time.sum()
+
+        for j in range(start, end):
+            if event_indicator[j]:
+                tied_time += n_censored_at_same_time
+                yield (j, start, end, censored_at_same_time, tied_time)
+
 
-        mask = np.zeros(n_samples, dtype=bool)
-        mask[end:] = True
-        # an event is comparable to censored samples at same time point
-        mask[i:end] = censored_at_same_time
+def _trapz(y, x):
+    """Integrate ``y`` over ``x`` with the composite trapezoidal rule.
 
-        for j in range(i, end):
-            if event_indicator[order[j]]:
-                tied_time += censored_at_same_time.sum()
-                yield (j, mask, tied_time)
-        i = end
+    Equivalent to :func:`numpy.trapz` for 1-d inputs, without the
+    axis handling overhead (and the NumPy 2 deprecation).
+    """
+    return 0.5 * np.sum((x[1:] - x[:-1]) * (y[1:] + y[:-1]))
+
+
+def _count_concordant_tied_numexpr(est, est_i, tied_tol):
+    """Fallback implementation of the concordance counting kernel.
+
+    A pair is tied iff its estimate falls into [lo, hi] and concordant
+    iff it falls strictly below, so both counts reduce to interval
+    tests against precomputed bounds; an event should have a higher
+    score. numexpr fuses comparison and reduction into a single pass
+    over ``est`` without materializing boolean temporaries.
+    """
+    if est.shape[0] == 0:
+        # do not hand zero-size arrays to numexpr reductions
+        return 0, 0
+    lo = est_i - tied_tol  # noqa: F841
+    hi = est_i + tied_tol  # noqa: F841
+    n_ties = numexpr.evaluate("sum(where((est >= lo) & (est <= hi), 1, 0))").item()
+    n_con = numexpr.evaluate("sum(where(est < lo, 1, 0))").item()
+    return n_con, n_ties
+
+
+def _count_concordant_tied(est, est_i, tied_tol):
+    """Count concordant pairs and pairs tied in risk against ``est_i``.
+
+    ``est`` holds the estimates of samples comparable to an event with
+    estimate ``est_i``. Dispatches to the compiled kernel when the
+    extension module is available and falls back to numexpr otherwise.
+    """
+    if _count_concordant_tied_ext is not None:
+        # the kernel is templated for float32 and float64, so single
+        # precision estimates are counted without an upcast
+        if est.dtype not in (np.float32, np.float64):
+            est = est.astype(np.float64)
+        return _count_concordant_tied_ext(
+            np.ascontiguousarray(est), est_i, tied_tol
+        )
+
+    return _count_concordant_tied_numexpr(est, est_i, tied_tol)
 
 
 def _estimate_concordance_index(
-    event_indicator, event_time, estimate, weights, tied_tol=1e-8
+    event_indicator, event_time, estimate, weights=None, tied_tol=1e-8
 ):
-    order = np.argsort(event_time)
+    # a stable sort keeps tied times in input order and lets NumPy use
+    # radix sort for integer-valued times
+    order = np.argsort(event_time, kind="stable")
+
+    # sort once up front so the loop below only touches contiguous slices
+    event_sorted = event_indicator[order]
+    time_sorted = event_time[order]
+    estimate_sorted = estimate[order]
+    # weights=None denotes unit weights without allocating them
+    weights_sorted = weights[order] if weights is not None else None
 
     tied_time = None
 
@@ -140,31 +203,39 @@ def _estimate_concordance_index(
     tied_risk = 0
     numerator = 0.0
     denominator = 0.0
-    for ind, mask, tied_time in _iter_comparable(
-        event_indicator, event_time, order
+    for ind, start, end, censored_at_same_time, tied_time in _iter_comparable(
+        event_sorted, time_sorted
     ):
-        est_i = estimate[order[ind]]
-        event_i = event_indicator[order[ind]]
-        w_i = weights[order[ind]]
-
-        est = estimate[order[mask]]
+        est_i = estimate_sorted[ind]
+        event_i = event_sorted[ind]
+        w_i = weights_sorted[ind] if weights_sorted is not None else 1.0
 
         assert (
             event_i
         ), f"got censored sample at index {order[ind]}, but expected uncensored"
 
-        ties = np.absolute(est - est_i) <= tied_tol
-        n_ties = ties.sum()
-        # an event should have a higher score
-        con = est < est_i
-        n_con = con[~ties].sum()
+        # comparable samples are the censored ones sharing the event's
+        # time point plus everything observed strictly later; both are
+        # contiguous ranges in the sorted order, so no n_samples-length
+        # mask has to be materialized
+        est_same = estimate_sorted[start:end][censored_at_same_time]
+        est_later = estimate_sorted[end:]
+
+        n_con = 0
+        n_ties = 0
+        n_comparable = 0
+        for est in (est_same, est_later):
+            con, ties = _count_concordant_tied(est, est_i, tied_tol)
+            n_con += con
+            n_ties += ties
+            n_comparable += est.shape[0]
 
         numerator += w_i * n_con + 0.5 * w_i * n_ties
-        denominator += w_i * mask.sum()
+        denominator += w_i * n_comparable
 
         tied_risk += n_ties
         concordant += n_con
-        discordant += est.size - n_con - n_ties
+        discordant += n_comparable - n_con - n_ties
 
     if tied_time is None:
         raise NoComparablePairException(
@@ -246,10 +317,8 @@ def concordance_index_censored(
         event_indicator, event_time, estimate
     )
 
-    w = np.ones_like(estimate)
-
     return _estimate_concordance_index(
-        event_indicator, event_time, estimate, w, tied_tol
+        event_indicator, event_time, estimate, tied_tol=tied_tol
     )
 
 
@@ -545,7 +614,7 @@ def cumulative_dynamic_auc(
             # to make sure that the curve starts at (0, 0)
             tp_no_ties = np.r_[0, tp_no_ties]
             fp_no_ties = np.r_[0, fp_no_ties]
-            scores[i] = np.trapz(tp_no_ties, fp_no_ties)
+            scores[i] = _trapz(tp_no_ties, fp_no_ties)
 
     if n_times == 1:
         mean_auc = scores[0]
@@ -672,17 +741,16 @@ def brier_score(survival_train, survival_test, estimate, times):
     prob_cens_y = cens.predict_proba(test_time)
     prob_cens_y[prob_cens_y == 0] = np.inf
 
-    # Calculating the brier scores at each time point
-    brier_scores = np.empty(times.shape[0], dtype=float)
-    for i, t in enumerate(times):
-        est = estimate[:, i]
-        is_case = (test_time <= t) & test_event
-        is_control = test_time > t
+    # Calculating the brier scores at all time points at once by
+    # broadcasting samples against times, shape = (n_samples, n_times)
+    is_case = (test_time[:, np.newaxis] <= times) & test_event[:, np.newaxis]
+    is_control = test_time[:, np.newaxis] > times
 
-        brier_scores[i] = np.mean(
-            np.square(est) * is_case.astype(int) / prob_cens_y
-            + np.square(1.0 - est) * is_control.astype(int) / prob_cens_t[i]
-        )
+    brier_scores = np.mean(
+        np.square(estimate) * is_case / prob_cens_y[:, np.newaxis]
+        + np.square(1.0 - estimate) * is_control / prob_cens_t,
+        axis=0,
+    )
 
     return times, brier_scores
 
@@ -793,7 +861,7 @@ def integrated_brier_score(survival_train, survival_test, estimate, times):
         raise ValueError("At least two time points must be given")
 
     # Computing the IBS
-    ibs_value = np.trapz(brier_scores, times) / (times[-1] - times[0])
+    ibs_value = _trapz(brier_scores, times) / (times[-1] - times[0])
 
     return ibs_value
 
@@ -11,7 +11,11 @@ from sklearn.metrics import mean_squared_error
 
 from sksurv.column import categorical_to_numeric, standardize
 from sksurv.datasets import load_whas500
-from sksurv.ensemble import ComponentwiseGradientBoostingSurvivalAnalysis, GradientBoostingSurvivalAnalysis
+from sksurv.ensemble import (
+    ComponentwiseGenGradientBoostingSurvivalAnalysis,
+    ComponentwiseGradientBoostingSurvivalAnalysis,
+    GradientBoostingSurvivalAnalysis,
+)
 from sksurv.testing import FixtureParameterFactory, assert_cindex_almost_equal
 from sksurv.util import Surv
 
@@ -677,6 +681,50 @@ class TestComponentwiseGradientBoosting:
             model.predict_cumulative_hazard_function(whas500_data.x)
 
 
+class TestComponentwiseGenGradientBoosting:
+    @staticmethod
+    def test_fit_n_jobs(make_whas500):
+        whas500_data = make_whas500(with_std=False, to_numeric=True)
+
+        model = ComponentwiseGenGradientBoostingSurvivalAnalysis(n_estimators=10, random_state=0)
+        model.fit(whas500_data.x, whas500_data.y)
+        expected = model.predict(whas500_data.x)
+
+        model_parallel = ComponentwiseGenGradientBoostingSurvivalAnalysis(
+            n_estimators=10, n_jobs=2, random_state=0
+        )
+        model_parallel.fit(whas500_data.x, whas500_data.y)
+
+        assert_array_almost_equal(expected, model_parallel.predict(whas500_data.x))
+
+    @staticmethod
+    def test_fit_dtype_float32(make_whas500):
+        whas500_data = make_whas500(with_std=False, to_numeric=True)
+
+        model = ComponentwiseGenGradientBoostingSurvivalAnalysis(n_estimators=10, random_state=0)
+        model.fit(whas500_data.x, whas500_data.y)
+        expected = model.predict(whas500_data.x)
+
+        model_f32 = ComponentwiseGenGradientBoostingSurvivalAnalysis(
+            n_estimators=10, dtype=np.float32, random_state=0
+        )
+        model_f32.fit(whas500_data.x, whas500_data.y)
+
+        assert_array_almost_equal(expected, model_f32.predict(whas500_data.x), decimal=4)
+
+    @staticmethod
+    def test_predict_without_input_checking(make_whas500):
+        whas500_data = make_whas500(with_std=False, to_numeric=True)
+
+        model = ComponentwiseGenGradientBoostingSurvivalAnalysis(n_estimators=10, random_state=0)
+        model.fit(whas500_data.x, whas500_data.y)
+
+        expected = model.predict(whas500_data.x)
+        actual = model.predict(whas500_data.x, check_input=False)
+
+        assert_array_almost_equal(expected, actual)
+
+
 @pytest.mark.parametrize(
     "model_cls,loss,dropout_rate",
     list(
@@ -11,6 +11,9 @@ from sksurv.exceptions import NoComparablePairException
 from sksurv.functions import StepFunction
 from sksurv.linear_model import CoxPHSurvivalAnalysis
 from sksurv.metrics import (
+    _count_concordant_tied,
+    _count_concordant_tied_ext,
+    _count_concordant_tied_numexpr,
     as_concordance_index_ipcw_scorer,
     as_cumulative_dynamic_auc_scorer,
     as_integrated_brier_score_scorer,
@@ -273,6 +276,51 @@ def test_concordance_index_no_comparable(no_comparable_pairs):
         concordance_index_censored(y["event"], y["time"], scores)
 
 
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_count_concordant_tied_kernel_matches_fallback(dtype):
+    if _count_concordant_tied_ext is None:
+        pytest.skip("_concordance extension has not been built")
+
+    tied_tol = 1e-8
+    rnd = np.random.RandomState(42)
+    est = np.round(rnd.uniform(-5, 5, size=1000), decimals=2).astype(dtype)
+
+    for est_i in (float(est[0]), 0.0, float(est.min()), float(est.max())):
+        expected = _count_concordant_tied_numexpr(est, est_i, tied_tol)
+        actual = _count_concordant_tied_ext(est, est_i, tied_tol)
+
+        assert actual == expected
+        assert actual == (
+            int(np.sum(est < est_i - tied_tol)),
+            int(np.sum(np.absolute(est.astype(np.float64) - est_i) <= tied_tol)),
+        )
+
+
+def test_count_concordant_tied_at_tied_tol_boundary():
+    tied_tol = 1e-3
+    est_i = 0.5
+    est = np.array([est_i - tied_tol, est_i + tied_tol, est_i - 2 * tied_tol, est_i + 2 * tied_tol, est_i])
+
+    # differences of exactly tied_tol count as tied, not concordant
+    expected = (1, 3)
+    assert _count_concordant_tied_numexpr(est, est_i, tied_tol) == expected
+    assert _count_concordant_tied(est, est_i, tied_tol) == expected
+    if _count_concordant_tied_ext is not None:
+        assert _count_concordant_tied_ext(est, est_i, tied_tol) == expected
+
+
+@pytest.mark.parametrize("dtype", [np.float64, np.float32])
+def test_count_concordant_tied_empty(dtype):
+    # est_same is empty for every event without tied censored samples,
+    # so the kernels are routinely called with zero-size arrays
+    est = np.array([], dtype=dtype)
+
+    assert _count_concordant_tied_numexpr(est, 0.0, 1e-8) == (0, 0)
+    assert _count_concordant_tied(est, 0.0, 1e-8) == (0, 0)
+    if _count_concordant_tied_ext is not None:
+        assert _count_concordant_tied_ext(est, 0.0, 1e-8) == (0, 0)
+
+
 class UnoCCases(FixtureParameterFactory):
     @property
     def y_train(self):